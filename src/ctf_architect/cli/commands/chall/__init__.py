@@ -7,10 +7,14 @@ from typing import Annotated
 
 from cyclopts import App, Parameter
 from cyclopts.types import ResolvedExistingDirectory, ResolvedExistingFile
+from rich.console import Group
 from rich.panel import Panel
 from rich.tree import Tree
 
-from ctf_architect.cli.ui.components import create_chall_config_panels
+from ctf_architect.cli.ui.components import (
+    VIOLATION_STYLES,
+    create_chall_config_panels,
+)
 from ctf_architect.cli.ui.console import console
 from ctf_architect.cli.ui.prompts import (
     confirm,
@@ -54,10 +58,22 @@ def _ask_and_create_chall(
     # Challenge Name
     _must_specify_folder_name = False
 
+    # Prompts reused across retries are built once, so their markup is only
+    # parsed a single time.
+    _name_prompt = input_str(":rocket: Enter the challenge name", allow_empty=False)
+    _invalid_name_select = select(
+        choices=[
+            "Different challenge name",
+            "Specify folder name manually",
+            "Abort",
+        ],
+        prompt="What would you like to do?",
+        return_index=True,
+        prompt_suffix="",
+    )
+
     while True:
-        name = input_str(
-            ":rocket: Enter the challenge name", allow_empty=False
-        ).execute()
+        name = _name_prompt.execute()
 
         if not valid_chall_name(name):
             console.print(
@@ -65,16 +81,7 @@ def _ask_and_create_chall(
                 style="ctfa.warning",
             )
 
-            _choice = select(
-                choices=[
-                    "Different challenge name",
-                    "Specify folder name manually",
-                    "Abort",
-                ],
-                prompt="What would you like to do?",
-                return_index=True,
-                prompt_suffix="",
-            ).execute()
+            _choice = _invalid_name_select.execute()
 
             if _choice == 0:
                 continue
@@ -138,7 +145,7 @@ def _ask_and_create_chall(
             if not extra_field.required:
                 if not confirm(
                     f"Would you like to provide the {extra_field.name} extra field? ({extra_field.description})"
-                ):
+                ).execute():
                     continue
 
             if extra_field.type == "string":
@@ -166,14 +173,15 @@ def _ask_and_create_chall(
     ).execute():
         requirements = []
 
+        _requirement_input = input_str(":gear: Enter a requirement", allow_empty=False)
+        _another_requirement = confirm("Do you want to add another requirement?")
+
         while True:
-            requirement = input_str(
-                ":gear: Enter a requirement", allow_empty=False
-            ).execute()
+            requirement = _requirement_input.execute()
 
             requirements.append(requirement)
 
-            if not confirm("Do you want to add another requirement?").execute():
+            if not _another_requirement.execute():
                 break
 
             # Add spacing
@@ -186,11 +194,19 @@ def _ask_and_create_chall(
     # Flags
     flags = []
 
+    _flag_type_select = select(
+        prompt=":triangular_flag: Select the type of flag to add",
+        choices=["Static", "Regex", "Finish"],
+    )
+    _flag_case_confirm = confirm("Is the flag case-insensitive?")
+    _flag_input = input_str(":triangular_flag: Enter the flag")
+    _another_flag = confirm("Would you like to add another flag?")
+    # Compiled on the first static flag, so a bad flag format in the config only
+    # matters if a static flag is actually checked against it
+    _flag_format = None
+
     while True:
-        _flag_type = select(
-            prompt=":triangular_flag: Select the type of flag to add",
-            choices=["Static", "Regex", "Finish"],
-        ).execute()
+        _flag_type = _flag_type_select.execute()
 
         if _flag_type == "Finish":
             if not flags:
@@ -199,15 +215,16 @@ def _ask_and_create_chall(
 
             break
 
-        _flag_case_insensitive = confirm("Is the flag case-insensitive?").execute()
+        _flag_case_insensitive = _flag_case_confirm.execute()
 
         if _flag_type == "Static":
+            if _flag_format is None and config.flag_format is not None:
+                _flag_format = re.compile(config.flag_format)
+
             while True:
-                _flag_content = input_str(":triangular_flag: Enter the flag").execute()
+                _flag_content = _flag_input.execute()
 
-                if config.flag_format is not None and not re.match(
-                    config.flag_format, _flag_content
-                ):
+                if _flag_format is not None and not _flag_format.match(_flag_content):
                     if not confirm(
                         "Flag does not match the expected format, are you sure you want to continue?"
                     ).execute():
@@ -240,7 +257,7 @@ def _ask_and_create_chall(
                 }
             )
 
-        if not confirm("Would you like to add another flag?").execute():
+        if not _another_flag.execute():
             break
 
         # Add spacing
@@ -251,31 +268,33 @@ def _ask_and_create_chall(
     # Hints
     if confirm(":bulb: Does the challenge have hints?").execute():
         hints = []
+        # Labels of the previous hints, shortened once as each hint is added
+        _hint_labels = []
+
+        _hint_input = multiline_input(":bulb: Enter the hint", allow_empty=False)
+        _hint_cost_input = input_int(":moneybag: Enter the hint cost")
+        _hint_requires_confirm = confirm(
+            ":lock: Does this hint require a previous hint to be unlocked?"
+        )
+        _another_hint = confirm("Would you like to add another hint?")
 
         while True:
-            _hint_content = multiline_input(
-                ":bulb: Enter the hint", allow_empty=False
-            ).execute()
-            _hint_cost = input_int(":moneybag: Enter the hint cost").execute()
-
-            if (
-                hints
-                and confirm(
-                    ":lock: Does this hint require a previous hint to be unlocked?"
-                ).execute()
-            ):
-                _hint_requirements = multi_select(
-                    choices=[
-                        shorten(
-                            " ".join(hint["content"].splitlines()),
-                            width=50,
-                            placeholder="...",
-                        )
-                        for hint in hints
-                    ],
-                    prompt=":lock: Select the hints required to unlock this hint",
-                    return_indexes=True,
-                ).execute()
+            _hint_content = _hint_input.execute()
+            _hint_cost = _hint_cost_input.execute()
+
+            if hints and _hint_requires_confirm.execute():
+                # Selected indexes come back as an unordered collection, and
+                # selecting nothing means the hint has no requirements
+                _hint_requirements = (
+                    sorted(
+                        multi_select(
+                            choices=_hint_labels,
+                            prompt=":lock: Select the hints required to unlock this hint",
+                            return_indexes=True,
+                        ).execute()
+                    )
+                    or None
+                )
             else:
                 _hint_requirements = None
 
@@ -286,8 +305,13 @@ def _ask_and_create_chall(
                     "requirements": _hint_requirements,
                 }
             )
+            _hint_labels.append(
+                shorten(
+                    " ".join(_hint_content.splitlines()), width=50, placeholder="..."
+                )
+            )
 
-            if not confirm("Would you like to add another hint?").execute():
+            if not _another_hint.execute():
                 break
 
             # Add spacing
@@ -302,10 +326,7 @@ def _ask_and_create_chall(
 
     # Distributable files
     if confirm("Does the challenge have distributable files?").execute():
-        dist_files = ask_dist_files()
-
-        if not dist_files:
-            dist_files = None
+        dist_files = ask_dist_files() or None
     else:
         dist_files = None
 
@@ -313,11 +334,7 @@ def _ask_and_create_chall(
 
     # Source files
     if confirm("Does the challenge have source files?").execute():
-        source_files = ask_source_files()
-
-        if not source_files:
-            source_files = None
-
+        source_files = ask_source_files() or None
     else:
         source_files = None
 
@@ -325,10 +342,7 @@ def _ask_and_create_chall(
 
     # Solution files
     if confirm("Does the challenge have solution files?").execute():
-        solution_files = ask_solution_files()
-
-        if not solution_files:
-            solution_files = None
+        solution_files = ask_solution_files() or None
     else:
         solution_files = None
 
@@ -340,33 +354,46 @@ def _ask_and_create_chall(
     ).execute():
         services = []
 
+        _service_type_select = select(
+            prompt=":computer: Select the service type",
+            choices=["Web", "TCP", "SSH", "Secret", "Internal", "Finish"],
+        )
+        _service_name_input = input_str(
+            ":computer: Enter the service name", validator=valid_service_name
+        )
+        _service_has_port = confirm("Does the service have a port?")
+        _service_port_input = input_int(
+            ":computer: Enter the service port", validator=valid_port
+        )
+        _another_port = confirm("Would you like to add another port?")
+        _another_service = confirm("Would you like to add another service?")
+
         while True:
-            _service_type = select(
-                prompt=":computer: Select the service type",
-                choices=["Web", "TCP", "SSH", "Secret", "Internal", "Finish"],
-            ).execute()
+            _service_type = _service_type_select.execute()
 
             if _service_type == "Finish":
                 break
 
-            _service_name = input_str(
-                ":computer: Enter the service name", validator=valid_service_name
-            ).execute()
+            _service_name = _service_name_input.execute()
 
-            if (
-                _service_type != "Internal"
-                or confirm("Does the service have a port?").execute()
-            ):
+            if _service_type != "Internal" or _service_has_port.execute():
                 _service_ports = []
+                # Set of the ports already added, for checking duplicates
+                _seen_ports = set()
 
                 while True:
-                    _service_port = input_int(
-                        ":computer: Enter the service port", validator=valid_port
-                    ).execute()
+                    _service_port = _service_port_input.execute()
 
-                    _service_ports.append(_service_port)
+                    if _service_port in _seen_ports:
+                        console.print(
+                            f":warning: Port {_service_port} has already been added, skipping...",
+                            style="ctfa.warning",
+                        )
+                    else:
+                        _service_ports.append(_service_port)
+                        _seen_ports.add(_service_port)
 
-                    if not confirm("Would you like to add another port?").execute():
+                    if not _another_port.execute():
                         break
             else:
                 _service_ports = None
@@ -386,7 +413,7 @@ def _ask_and_create_chall(
                 }
             )
 
-            if not confirm("Would you like to add another service?").execute():
+            if not _another_service.execute():
                 break
 
             # Add spacing
@@ -401,23 +428,26 @@ def _ask_and_create_chall(
     # Add spacing
     console.print()
 
-    for panel in create_chall_config_panels(
-        name=name,
-        folder_name=folder_name,
-        description=description,
-        category=category,  # type: ignore
-        difficulty=difficulty,  # type: ignore
-        author=author,
-        requirements=requirements,
-        extras=extras,
-        flags=flags,
-        hints=hints,
-        dist_files=dist_files,
-        source_files=source_files,
-        solution_files=solution_files,
-        services=services,
-    ):
-        console.print(panel)
+    console.print(
+        Group(
+            *create_chall_config_panels(
+                name=name,
+                folder_name=folder_name,
+                description=description,
+                category=category,  # type: ignore
+                difficulty=difficulty,  # type: ignore
+                author=author,
+                requirements=requirements,
+                extras=extras,
+                flags=flags,
+                hints=hints,
+                dist_files=dist_files,
+                source_files=source_files,
+                solution_files=solution_files,
+                services=services,
+            )
+        )
+    )
 
     if confirm("Is the challenge configuration correct?").execute():
         init_chall(
@@ -546,13 +576,6 @@ def lint(
     else:
         config = load_repo_config(ctf_config)
 
-    VIOLATION_STYLES = {
-        SeverityLevel.FATAL: ("ctfa.lint.level.fatal", "✕"),
-        SeverityLevel.ERROR: ("ctfa.lint.level.error", "✕"),
-        SeverityLevel.WARNING: ("ctfa.lint.level.warning", "⚠"),
-        SeverityLevel.INFO: ("ctfa.lint.level.info", "🛈"),
-    }
-
     result = lint_challenge(chall_path, ctf_config=config, level=level, ignore=ignore)
 
     if result.failed or result.errors:
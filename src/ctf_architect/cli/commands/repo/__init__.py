@@ -8,6 +8,7 @@ from zipfile import ZipFile
 
 from cyclopts import App, Parameter
 from cyclopts.types import ResolvedExistingDirectory
+from rich.console import Group
 from rich.panel import Panel
 from rich.tree import Tree
 
@@ -15,7 +16,10 @@ from ctf_architect.cli.commands.repo.compose import app as compose_app
 from ctf_architect.cli.commands.repo.config import app as config_app
 from ctf_architect.cli.commands.repo.mapping import app as mapping_app
 from ctf_architect.cli.commands.repo.stats import app as stats_app
-from ctf_architect.cli.ui.components import create_repo_config_panels
+from ctf_architect.cli.ui.components import (
+    VIOLATION_STYLES,
+    create_repo_config_panels,
+)
 from ctf_architect.cli.ui.console import console
 from ctf_architect.cli.ui.prompts import (
     InvalidResponse,
@@ -24,7 +28,7 @@ from ctf_architect.cli.ui.prompts import (
     input_str,
     select,
 )
-from ctf_architect.cli.validators import no_empty_string, valid_port
+from ctf_architect.cli.validators import valid_port
 from ctf_architect.constants import CTF_CONFIG_FILE
 from ctf_architect.core.challenge import is_challenge_folder
 from ctf_architect.core.exceptions import ChallengeExistsError
@@ -52,6 +56,46 @@ app.command(mapping_app)
 app.command(stats_app)
 
 
+def _ask_names(kind: str, plural: str) -> list[str]:
+    """Prompts for names one per line until an empty line is entered.
+
+    Args:
+        kind (str): The kind of name being asked for, e.g. "category".
+        plural (str): The plural form of `kind`, used in messages.
+
+    Returns:
+        list[str]: The names entered, at least one.
+    """
+    names = []
+
+    def _at_least_one(response: str) -> None:
+        if response == "" and not names:
+            raise InvalidResponse(f"[ctfa.prompt.error]At least one {kind} is required")
+
+    console.print(
+        f"Enter the {plural} for the CTF (one per line, empty line to stop).",
+        style="ctfa.info",
+    )
+
+    name_prompt = input_str(
+        f"{kind.capitalize()} Name (empty to stop)", validator=_at_least_one
+    )
+
+    while True:
+        name = name_prompt.execute()
+
+        if name == "":
+            break
+
+        names.append(name)
+        console.print(f'{kind.capitalize()} "{name}" added.', style="ctfa.success")
+
+        # Add spacing
+        console.print()
+
+    return names
+
+
 @app.command(group="Initialization")
 def init(
     *,
@@ -138,7 +182,7 @@ def init(
 
     if not name:
         name = input_str(
-            prompt="Enter the name of the CTF", validator=no_empty_string
+            prompt="Enter the name of the CTF", allow_empty=False
         ).execute()
 
     console.print(f"CTF Name: {name}", style="ctfa.info")
@@ -172,75 +216,27 @@ def init(
     console.rule("[ctfa.title]Challenge Categories[/ctfa.title]")
 
     if not categories:
-        _categories = []
-
-        def _at_least_one_category(response: str) -> None:
-            if response == "" and not _categories:
-                raise InvalidResponse(
-                    "[ctfa.prompt.error]At least one category is required"
-                )
-
-        console.print(
-            "Enter the categories for the CTF (one per line, empty line to stop).",
-            style="ctfa.info",
-        )
-
-        while True:
-            category = input_str(
-                "Category Name (empty to stop)", validator=_at_least_one_category
-            ).execute()
-
-            if category == "":
-                break
-
-            _categories.append(category.lower())
-            console.print(f'Category "{category}" added.', style="ctfa.success")
-
-            # Add spacing
-            console.print()
-
-        categories = _categories
+        categories = [
+            category.lower() for category in _ask_names("category", "categories")
+        ]
 
-    console.print("Categories:", style="ctfa.info")
-    for category in categories:
-        console.print(f"  - {category.capitalize()}", style="ctfa.info")
+    console.print(
+        "Categories:\n"
+        + "\n".join(f"  - {category.capitalize()}" for category in categories),
+        style="ctfa.info",
+    )
 
     console.print()
     console.rule("[ctfa.title]Challenge Difficulties[/ctfa.title]")
 
     if not difficulties:
-        _difficulties = []
-
-        def _at_least_one_difficulty(response: str) -> None:
-            if response == "" and not _difficulties:
-                raise InvalidResponse(
-                    "[ctfa.prompt.error]At least one difficulty is required"
-                )
-
-        console.print(
-            "Enter the difficulties for the CTF (empty name to stop).",
-            style="ctfa.info",
-        )
-
-        while True:
-            difficulty = input_str(
-                "Difficulty Name (empty to stop)", validator=_at_least_one_difficulty
-            ).execute()
-
-            if difficulty == "":
-                break
-
-            _difficulties.append(difficulty)
-            console.print(f'Difficulty "{difficulty}" added.', style="ctfa.success")
+        difficulties = _ask_names("difficulty", "difficulties")
 
-            # Add spacing
-            console.print()
-
-        difficulties = _difficulties
-
-    console.print("Difficulties:", style="ctfa.info")
-    for difficulty in difficulties:
-        console.print(f"  - {difficulty.capitalize()}", style="ctfa.info")
+    console.print(
+        "Difficulties:\n"
+        + "\n".join(f"  - {difficulty.capitalize()}" for difficulty in difficulties),
+        style="ctfa.info",
+    )
 
     console.print()
     console.rule("[ctfa.title]Extra Fields[/ctfa.title]")
@@ -294,65 +290,27 @@ def init(
     else:
         extras = None
 
-    console.print("Extra Fields:", style="ctfa.info")
     if extras:
-        for extra in extras:
-            console.print(f"  - {extra['name']} ({extra['type']})", style="ctfa.info")
+        extras_string = "\n".join(
+            f"  - {extra['name']} ({extra['type']})" for extra in extras
+        )
     else:
-        console.print("  - None", style="ctfa.info")
-
-    # ctf_config_panel = Panel(
-    #     (
-    #         f" CTF Name: {name}\n"
-    #         f" Flag Format: {flag_format if flag_format else 'None'}\n"
-    #         f" Starting Port: {starting_port if starting_port else 'None'}\n"
-    #     ),
-    #     title="CTF Config",
-    #     title_align="left",
-    #     style="ctfa.info",
-    #     border_style="green",
-    # )
-
-    # categories_panel = Panel(
-    #     "\n".join([f"  - {category.capitalize()}" for category in categories]),
-    #     title="Categories",
-    #     title_align="left",
-    #     style="ctfa.info",
-    #     border_style="green",
-    # )
-
-    # difficulties_panel = Panel(
-    #     "\n".join([f"  - {difficulty.capitalize()}" for difficulty in difficulties]),
-    #     title="Difficulties",
-    #     title_align="left",
-    #     style="ctfa.info",
-    #     border_style="green",
-    # )
-
-    # extras_panel = Panel(
-    #     "\n".join([f"  - {extra['name']} ({extra['type']})" for extra in extras])
-    #     if extras
-    #     else "  - None",
-    #     title="Extras",
-    #     title_align="left",
-    #     style="ctfa.info",
-    #     border_style="green",
-    # )
-
-    # console.print(ctf_config_panel)
-    # console.print(categories_panel)
-    # console.print(difficulties_panel)
-    # console.print(extras_panel)
-
-    for panel in create_repo_config_panels(
-        name=name,
-        flag_format=flag_format,
-        starting_port=starting_port,
-        categories=categories,
-        difficulties=difficulties,
-        extras=extras,  # type: ignore
-    ):
-        console.print(panel)
+        extras_string = "  - None"
+
+    console.print(f"Extra Fields:\n{extras_string}", style="ctfa.info")
+
+    console.print(
+        Group(
+            *create_repo_config_panels(
+                name=name,
+                flag_format=flag_format,
+                starting_port=starting_port,
+                categories=categories,
+                difficulties=difficulties,
+                extras=extras,  # type: ignore
+            )
+        )
+    )
 
     if confirm("Are you sure you want to create this Challenge Repository?").execute():
         init_repo_no_config(
@@ -590,13 +548,6 @@ def lint(
         )
         return
 
-    VIOLATION_STYLES = {
-        SeverityLevel.FATAL: ("ctfa.lint.level.fatal", "✕"),
-        SeverityLevel.ERROR: ("ctfa.lint.level.error", "✕"),
-        SeverityLevel.WARNING: ("ctfa.lint.level.warning", "⚠"),
-        SeverityLevel.INFO: ("ctfa.lint.level.info", "🛈"),
-    }
-
     # Lint all challenges
     if challenges is None:
         results = lint_challenge_repo(level=level, ignore=ignore, by_category=True)
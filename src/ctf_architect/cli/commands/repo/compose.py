@@ -7,7 +7,6 @@ from cyclopts import App, Parameter
 
 from ctf_architect.cli.ui.console import console
 from ctf_architect.cli.ui.prompts import confirm
-from ctf_architect.core.compose import create_compose_files, get_compose_file_path
 from ctf_architect.core.repo import is_challenge_repo
 
 app = App(
@@ -26,6 +25,7 @@ def generate(
     Args:
         force: Force generation of compose files.
     """
+    from ctf_architect.core.compose import create_compose_files, get_compose_file_path
 
     if not is_challenge_repo():
         console.print(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from cyclopts import App
+from rich.console import Group
 
 from ctf_architect.cli.ui.components import create_repo_config_panels
 from ctf_architect.cli.ui.console import console
@@ -23,12 +24,15 @@ def show():
         )
         return
 
-    for panel in create_repo_config_panels(
-        name=config.name,
-        flag_format=config.flag_format,
-        starting_port=config.starting_port,
-        categories=config.categories,
-        difficulties=config.difficulties,
-        extras=config.extras,
-    ):
-        console.print(panel)
+    console.print(
+        Group(
+            *create_repo_config_panels(
+                name=config.name,
+                flag_format=config.flag_format,
+                starting_port=config.starting_port,
+                categories=config.categories,
+                difficulties=config.difficulties,
+                extras=config.extras,
+            )
+        )
+    )
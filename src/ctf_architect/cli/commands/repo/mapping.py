@@ -6,11 +6,6 @@ from rich.align import Align
 from ctf_architect.cli.ui.components import create_mapping_table
 from ctf_architect.cli.ui.console import console
 from ctf_architect.cli.ui.prompts import confirm
-from ctf_architect.core.port_mapping import (
-    generate_port_mapping,
-    load_port_mapping,
-    save_port_mapping,
-)
 from ctf_architect.core.repo import is_challenge_repo
 
 app = App(
@@ -24,6 +19,8 @@ app = App(
 @app.command
 def show():
     """Show the port mappings for challenge services"""
+    from ctf_architect.core.port_mapping import load_port_mapping
+
     try:
         mapping = load_port_mapping()
         table = create_mapping_table(mapping)
@@ -38,6 +35,11 @@ def show():
 @app.command
 def generate():
     """Generates port mappings for challenge services"""
+    from ctf_architect.core.port_mapping import (
+        generate_port_mapping,
+        save_port_mapping,
+    )
+
     if not is_challenge_repo():
         console.print(
             "This is not a challenge repository. Are you in the right directory?",
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import sys
-from typing import Literal
+from collections.abc import Callable
+from functools import cache
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 from ctf_architect.cli.ui.console import console
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
+_T = TypeVar("_T")
+
 _tkinter_available = False
 
 
@@ -23,7 +30,23 @@ try:
 except ImportError:
     askdirectory = askopenfilename = askopenfilenames = _handle_unavailable_tkinter
 
-if _tkinter_available:
+
+@cache
+def _get_root() -> tk.Tk | None:
+    """Creates the hidden Tk root window used by the file dialogs.
+
+    This is deferred until the first dialog is opened, so that commands which never
+    show a dialog (and `--help`) do not pay for Tk startup.
+
+    Returns:
+        tk.Tk | None: The root window, or None if Tk could not be initialised or the
+            CLI is not running interactively.
+    """
+    # When driven from a script (output piped or input redirected) there is nobody
+    # to interact with the dialog, so skip importing and starting Tk entirely
+    if not (console.is_terminal and sys.stdin.isatty()):
+        return None
+
     if sys.platform.startswith("win"):
         # Set DPI awareness to make the file dialog not blurry on Windows
         try:
@@ -35,11 +58,46 @@ if _tkinter_available:
 
     import tkinter as tk
 
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+
     # Force the window to be on top
-    _root = tk.Tk()
-    _root.withdraw()
+    root.withdraw()
+    root.attributes("-topmost", True)
+
+    return root
+
+
+def run_dialog(dialog: Callable[..., _T], *args, **kwargs) -> _T:
+    """Runs a file dialog parented to the hidden Tk root window.
+
+    The dialog is run on the main thread, which owns the Tk interpreter. Tk dialogs
+    run their own event loop until they are closed, so nothing else needs to pump
+    Tk events.
+
+    Args:
+        dialog (Callable): The file dialog function to run.
+        *args: Positional arguments to pass to the dialog.
+        **kwargs: Keyword arguments to pass to the dialog.
+
+    Returns:
+        The result of the dialog.
+    """
+    if not _tkinter_available:
+        return dialog(*args, **kwargs)
+
+    root = _get_root()
+
+    if root is None:
+        return _handle_unavailable_tkinter()
+
+    # Parent the dialog to our hidden root, rather than relying on tkinter's
+    # implicit default root
+    kwargs.setdefault("parent", root)
 
-    _root.attributes("-topmost", True)
+    return dialog(*args, **kwargs)
 
 
-__all__ = ["askdirectory", "askopenfilename", "askopenfilenames"]
+__all__ = ["askdirectory", "askopenfilename", "askopenfilenames", "run_dialog"]
@@ -4,6 +4,7 @@ from pathlib import Path
 from types import EllipsisType
 from typing import Iterable
 
+from rich.console import RenderableType
 from rich.panel import Panel
 from rich.table import Table
 
@@ -15,8 +16,48 @@ from ctf_architect.core.initialize import (
 )
 from ctf_architect.models.challenge import Flag, Hint, Service
 from ctf_architect.models.ctf_config import ExtraField
+from ctf_architect.models.lint import SeverityLevel
 from ctf_architect.models.port_mapping import PortMapping
 
+# Style and icon used to render lint violations of each severity level
+VIOLATION_STYLES: dict[SeverityLevel, tuple[str, str]] = {
+    SeverityLevel.FATAL: ("ctfa.lint.level.fatal", "✕"),
+    SeverityLevel.ERROR: ("ctfa.lint.level.error", "✕"),
+    SeverityLevel.WARNING: ("ctfa.lint.level.warning", "⚠"),
+    SeverityLevel.INFO: ("ctfa.lint.level.info", "🛈"),
+}
+
+
+def _info_panel(content: RenderableType, title: str) -> Panel:
+    """Creates a panel in the style shared by all config summary panels.
+
+    Args:
+        content (RenderableType): The content of the panel.
+        title (str): The title of the panel.
+
+    Returns:
+        Panel: The styled panel.
+    """
+    return Panel(
+        content,
+        title=title,
+        title_align="left",
+        style="ctfa.info",
+        border_style="green",
+    )
+
+
+def _bullet_list(items: Iterable[object]) -> str:
+    """Formats items as an indented bullet list for a config summary panel.
+
+    Args:
+        items (Iterable[object]): The items to list.
+
+    Returns:
+        str: One bullet per item, or a single "None" bullet if there are no items.
+    """
+    return "\n".join(f"  - {item}" for item in items) or "  - None"
+
 
 def create_repo_config_panels(
     name: str,
@@ -28,52 +69,36 @@ def create_repo_config_panels(
 ) -> Iterable[Panel]:
     _panels = []
 
-    ctf_config_panel = Panel(
+    ctf_config_panel = _info_panel(
         (
             f" CTF Name: {name}\n"
             f" Flag Format: {flag_format if flag_format else 'None'}\n"
             f" Starting Port: {starting_port if starting_port else 'None'}"
         ),
         title="CTF Config",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(ctf_config_panel)
 
-    categories_panel = Panel(
-        "\n".join([f"  - {category.capitalize()}" for category in categories]),
+    categories_panel = _info_panel(
+        _bullet_list(category.capitalize() for category in categories),
         title="Categories",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(categories_panel)
 
-    difficulties_panel = Panel(
-        "\n".join([f"  - {difficulty.capitalize()}" for difficulty in difficulties]),
+    difficulties_panel = _info_panel(
+        _bullet_list(difficulty.capitalize() for difficulty in difficulties),
         title="Difficulties",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(difficulties_panel)
 
-    extras_panel = Panel(
-        "\n".join(
-            [
-                f"  - {extra['name']} ({extra['type']})"
-                if isinstance(extra, dict)
-                else f"  - {extra.name} ({extra.type})"
-                for extra in extras
-            ]
-        )
-        if extras
-        else "  - None",
+    extras_panel = _info_panel(
+        _bullet_list(
+            f"{extra['name']} ({extra['type']})"
+            if isinstance(extra, dict)
+            else f"{extra.name} ({extra.type})"
+            for extra in extras or ()
+        ),
         title="Extras",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(extras_panel)
 
@@ -117,7 +142,7 @@ def create_chall_config_panels(
 ) -> Iterable[Panel]:
     _panels = []
 
-    chall_config_panel = Panel(
+    chall_config_panel = _info_panel(
         (
             f" Name: {name}\n"
             f" Author: {author}\n"
@@ -127,82 +152,49 @@ def create_chall_config_panels(
             f" Folder Name: {folder_name if folder_name else 'None'}"
         ),
         title=":gear: Challenge Config",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(chall_config_panel)
 
-    requirements_panel = Panel(
-        "\n".join([f"  - {requirement}" for requirement in requirements])
-        if requirements
-        else "  - None",
+    requirements_panel = _info_panel(
+        _bullet_list(requirements or ()),
         title=":gear: Requirements",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(requirements_panel)
 
-    extras_panel = Panel(
-        "\n".join([f"  - {key}: {value}" for key, value in extras.items()])
-        if extras
-        else "  - None",
+    extras_panel = _info_panel(
+        _bullet_list(f"{key}: {value}" for key, value in (extras or {}).items()),
         title=":package: Extras",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(extras_panel)
 
-    hints_panel = Panel(
-        "\n".join(
-            [
-                f"  - {hint['content']} ({hint['cost']} points)"
-                if isinstance(hint, dict)
-                else f"  - {hint.content} ({hint.cost} points)"
-                for hint in hints
-            ]
-        )
-        if hints
-        else "  - None",
+    hints_panel = _info_panel(
+        _bullet_list(
+            f"{hint['content']} ({hint['cost']} points)"
+            if isinstance(hint, dict)
+            else f"{hint.content} ({hint.cost} points)"
+            for hint in hints or ()
+        ),
         title=":bulb: Hints",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(hints_panel)
 
-    dist_files_panel = Panel(
-        "\n".join([f"  - {file}" for file in dist_files]) if dist_files else "  - None",
+    dist_files_panel = _info_panel(
+        _bullet_list(dist_files or ()),
         title=":file_folder: Dist Files",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(dist_files_panel)
 
     if source_files != ...:
-        source_files_panel = Panel(
-            "\n".join([f"  - {file}" for file in source_files])
-            if source_files
-            else "  - None",
+        source_files_panel = _info_panel(
+            _bullet_list(source_files or ()),
             title=":file_folder: Source Files",
-            title_align="left",
-            style="ctfa.info",
-            border_style="green",
         )
         _panels.append(source_files_panel)
 
     if solution_files != ...:
-        solution_files_panel = Panel(
-            "\n".join([f"  - {file}" for file in solution_files])
-            if solution_files
-            else "  - None",
+        solution_files_panel = _info_panel(
+            _bullet_list(solution_files or ()),
             title=":file_folder: Solution Files",
-            title_align="left",
-            style="ctfa.info",
-            border_style="green",
         )
         _panels.append(solution_files_panel)
 
@@ -227,22 +219,16 @@ def create_chall_config_panels(
                 str(flag.case_insensitive),
             )
 
-    flags_panel = Panel(
+    flags_panel = _info_panel(
         flags_table,
         title=":triangular_flag: Flags",
-        title_align="left",
-        style="ctfa.info",
-        border_style="green",
     )
     _panels.append(flags_panel)
 
     if services is None:
-        service_panel = Panel(
+        service_panel = _info_panel(
             "  - None",
             title=":computer: Services",
-            title_align="left",
-            style="ctfa.info",
-            border_style="green",
         )
     else:
         services_table = Table()
@@ -255,12 +241,12 @@ def create_chall_config_panels(
 
         for service in services:
             if isinstance(service, dict):
-                if "port" in service:
+                # Internal services may have no port at all, in which case
+                # "ports" is present but None
+                if service.get("port") is not None:
                     _ports = [service["port"]]
-                elif "ports" in service:
-                    _ports = service["ports"]
                 else:
-                    _ports = []
+                    _ports = service.get("ports") or []
 
                 services_table.add_row(
                     service["name"],
@@ -277,12 +263,9 @@ def create_chall_config_panels(
                     service.type,
                 )
 
-        service_panel = Panel(
+        service_panel = _info_panel(
             services_table,
             title=":computer: Services",
-            title_align="left",
-            style="ctfa.info",
-            border_style="green",
         )
     _panels.append(service_panel)
 
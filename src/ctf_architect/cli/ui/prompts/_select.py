@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Generic, TypeVar, cast
 
 from readchar import key as _key
@@ -8,18 +9,17 @@ from rich.console import Console
 from rich.live import Live
 from rich.text import Text, TextType
 
-from ctf_architect.cli.ui.prompts.base import PromptBase
+from ctf_architect.cli.ui.prompts.base import PromptBase, render_header
 from ctf_architect.cli.ui.prompts.session import PromptSession
 
 SelectType = TypeVar("SelectType")
 
 
-NEWLINE_RESET = Text("\n", style="reset")
-
-
 class Select(PromptBase, Generic[SelectType]):
     helper_text = "Use arrow keys (↑/↓) or k/j to move and press Enter to select"
     prompt_pointer = "\u276f "
+    up_keys = frozenset({_key.UP, "k"})
+    down_keys = frozenset({_key.DOWN, "j"})
 
     def __init__(
         self,
@@ -39,41 +39,39 @@ class Select(PromptBase, Generic[SelectType]):
         self.prompt_suffix = prompt_suffix
         super().__init__(prompt, console=console)
 
-    def render_choices(self, selected_index: int) -> TextType:
-        if self.prompt.plain:
-            # choices_text = (
-            #     self.prompt.copy()
-            #     .append(self.prompt_suffix)
-            #     .append("\n")
-            #     .append(self.helper_text, style="ctfa.prompt.message")
-            #     .append_text(NEWLINE_RESET)
-            # )
-            choices_text = (
-                Text(self.helper_text, style="ctfa.prompt.message")
-                .append("\n")
-                .append_text(self.prompt.copy())
-                .append(self.prompt_suffix)
-                .append_text(NEWLINE_RESET)
-            )
-        else:
-            choices_text = Text(
-                self.helper_text, style="ctfa.prompt.message"
-            ).append_text(NEWLINE_RESET)
+    @cached_property
+    def _header(self) -> Text:
+        # The header does not change while the prompt is running, so it is built
+        # once and copied for every redraw
+        return render_header(self.helper_text, self.prompt, self.prompt_suffix)
 
+    @cached_property
+    def _rows(self) -> tuple[list[Text], list[Text]]:
+        # Every row is styled once, as both its unselected and selected variant, so
+        # a redraw only has to pick the right variant for each row
         indent_str = " " * self.indent
 
-        for i, choice in enumerate(self.choices):
-            if i == selected_index:
-                choices_text.append(
-                    f"{indent_str}{self.prompt_pointer}", style="ctfa.prompt.pointer"
-                )
-                choices_text.append(f"{choice}", style="ctfa.prompt.selected")
-            else:
-                choices_text.append(
-                    f"{indent_str}  {choice}", style="ctfa.prompt.unselected"
-                )
+        unselected_rows = [
+            Text(f"{indent_str}  {choice}\n", style="ctfa.prompt.unselected")
+            for choice in self.choices
+        ]
+        selected_rows = [
+            Text.assemble(
+                (f"{indent_str}{self.prompt_pointer}", "ctfa.prompt.pointer"),
+                (f"{choice}", "ctfa.prompt.selected"),
+                "\n",
+            )
+            for choice in self.choices
+        ]
+        return unselected_rows, selected_rows
+
+    def render_choices(self, selected_index: int) -> TextType:
+        choices_text = self._header.copy()
 
-            choices_text.append("\n")
+        unselected_rows, selected_rows = self._rows
+
+        for i, row in enumerate(unselected_rows):
+            choices_text.append_text(selected_rows[i] if i == selected_index else row)
 
         return choices_text
 
@@ -106,14 +104,21 @@ class Select(PromptBase, Generic[SelectType]):
 
             key = readkey()
 
-            if key == _key.UP or key == "k":
-                selected_index = max(0, selected_index - 1)
-            elif key == _key.DOWN or key == "j":
-                selected_index = min(len(self.choices) - 1, selected_index + 1)
+            if key in self.up_keys:
+                if selected_index == 0:
+                    continue
+                selected_index -= 1
+            elif key in self.down_keys:
+                if selected_index == len(self.choices) - 1:
+                    continue
+                selected_index += 1
             elif key == _key.ENTER:
                 live.update(self.render_result(selected_index), refresh=True)
                 live.stop()
                 break
+            else:
+                # Other keys do not change anything, so there is nothing to redraw
+                continue
 
             live.update(self.render_choices(selected_index), refresh=True)
 
@@ -138,6 +143,8 @@ class MultiSelect(PromptBase, Generic[SelectType]):
     prompt_pointer = "\u276f "
     prompt_toggled_on = "\u2611 "
     prompt_toggled_off = "\u2610 "
+    up_keys = frozenset({_key.UP, "k"})
+    down_keys = frozenset({_key.DOWN, "j"})
 
     def __init__(
         self,
@@ -157,51 +164,57 @@ class MultiSelect(PromptBase, Generic[SelectType]):
         self.prompt_suffix = prompt_suffix
         super().__init__(prompt, console=console)
 
-    def render_choices(
-        self, current_index: int, selected_indexes: set[int], final: bool = False
-    ) -> TextType:
-        if self.prompt.plain:
-            # choices_text = (
-            #     self.prompt.copy()
-            #     .append(self.prompt_suffix)
-            #     .append("\n")
-            #     .append(self.helper_text, style="ctfa.prompt.message")
-            #     .append_text(NEWLINE_RESET)
-            # )
-            choices_text = (
-                Text(self.helper_text, style="ctfa.prompt.message")
-                .append("\n")
-                .append_text(self.prompt.copy())
-                .append(self.prompt_suffix)
-                .append_text(NEWLINE_RESET)
-            )
-        else:
-            choices_text = Text(
-                self.helper_text, style="ctfa.prompt.message"
-            ).append_text(NEWLINE_RESET)
+    @cached_property
+    def _header(self) -> Text:
+        # The header does not change while the prompt is running, so it is built
+        # once and copied for every redraw
+        return render_header(self.helper_text, self.prompt, self.prompt_suffix)
 
+    @cached_property
+    def _pointers(self) -> tuple[Text, Text]:
         indent_str = " " * self.indent
+        return (
+            Text(f"{indent_str}{self.prompt_pointer}", style="ctfa.prompt.pointer"),
+            Text(f"{indent_str}  "),
+        )
 
-        for i, choice in enumerate(self.choices):
-            if i == current_index and not final:
-                choices_text.append(
-                    f"{indent_str}{self.prompt_pointer}", style="ctfa.prompt.pointer"
-                )
-            else:
-                choices_text.append(f"{indent_str}  ")
+    @cached_property
+    def _rows(self) -> tuple[list[Text], list[Text]]:
+        # Every row is styled once, as both its toggled off and toggled on variant,
+        # so a redraw only has to pick the right variant for each row
+        toggled_off_rows = [
+            Text.assemble(
+                (self.prompt_toggled_off, "ctfa.prompt.toggled_off"),
+                (f"{choice}", "ctfa.prompt.unselected"),
+                "\n",
+            )
+            for choice in self.choices
+        ]
+        toggled_on_rows = [
+            Text.assemble(
+                (self.prompt_toggled_on, "ctfa.prompt.toggled_on"),
+                (f"{choice}", "ctfa.prompt.selected"),
+                "\n",
+            )
+            for choice in self.choices
+        ]
+        return toggled_off_rows, toggled_on_rows
 
-            if i in selected_indexes:
-                choices_text.append(
-                    self.prompt_toggled_on, style="ctfa.prompt.toggled_on"
-                )
-                choices_text.append(f"{choice}", style="ctfa.prompt.selected")
-            else:
-                choices_text.append(
-                    self.prompt_toggled_off, style="ctfa.prompt.toggled_off"
-                )
-                choices_text.append(f"{choice}", style="ctfa.prompt.unselected")
+    def render_choices(
+        self, current_index: int, selected_indexes: set[int], final: bool = False
+    ) -> TextType:
+        choices_text = self._header.copy()
 
-            choices_text.append("\n")
+        pointer, no_pointer = self._pointers
+        toggled_off_rows, toggled_on_rows = self._rows
+
+        for i, row in enumerate(toggled_off_rows):
+            choices_text.append_text(
+                pointer if i == current_index and not final else no_pointer
+            )
+            choices_text.append_text(
+                toggled_on_rows[i] if i in selected_indexes else row
+            )
 
         return choices_text
 
@@ -228,10 +241,14 @@ class MultiSelect(PromptBase, Generic[SelectType]):
 
             key = readkey()
 
-            if key == _key.UP or key == "k":
-                current_index = max(0, current_index - 1)
-            elif key == _key.DOWN or key == "j":
-                current_index = min(len(self.choices) - 1, current_index + 1)
+            if key in self.up_keys:
+                if current_index == 0:
+                    continue
+                current_index -= 1
+            elif key in self.down_keys:
+                if current_index == len(self.choices) - 1:
+                    continue
+                current_index += 1
             elif key == _key.SPACE:
                 if current_index in selected_indexes:
                     selected_indexes.remove(current_index)
@@ -244,6 +261,9 @@ class MultiSelect(PromptBase, Generic[SelectType]):
                 )
                 live.stop()
                 break
+            else:
+                # Other keys do not change anything, so there is nothing to redraw
+                continue
 
             live.update(
                 self.render_choices(current_index, selected_indexes), refresh=True
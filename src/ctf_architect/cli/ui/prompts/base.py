@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
 from rich.console import Console
@@ -9,6 +10,44 @@ from rich.text import Text, TextType
 from ctf_architect.cli.ui.console import console as _console
 from ctf_architect.cli.ui.prompts.session import PromptSession
 
+NEWLINE_RESET = Text("\n", style="reset")
+
+
+def render_header(helper_text: str, prompt: Text, prompt_suffix: str) -> Text:
+    """Renders the helper text and prompt shown above a prompt's input.
+
+    Args:
+        helper_text (str): The usage help shown above the prompt.
+        prompt (Text): The prompt message, which may be empty.
+        prompt_suffix (str): The suffix appended to the prompt message.
+
+    Returns:
+        Text: The rendered header, ending with a newline.
+    """
+    header = Text(helper_text, style="ctfa.prompt.message")
+
+    if prompt.plain:
+        header.append("\n").append_text(prompt.copy()).append(prompt_suffix)
+
+    return header.append_text(NEWLINE_RESET)
+
+
+@lru_cache(maxsize=256)
+def _parse_prompt(prompt: str) -> Text:
+    """Parses a prompt message, caching the result.
+
+    The same messages are prompted for repeatedly (e.g. once per flag or hint), so
+    the markup only needs to be parsed once. The returned Text is shared, so it must
+    be copied before being modified.
+
+    Args:
+        prompt (str): The prompt message, which may contain console markup.
+
+    Returns:
+        Text: The parsed prompt message.
+    """
+    return Text.from_markup(prompt, style="ctfa.prompt.message")
+
 
 class PromptBase(ABC):
     def __init__(
@@ -18,9 +57,7 @@ class PromptBase(ABC):
         console: Console | None = None,
     ):
         self.prompt = (
-            Text.from_markup(prompt, style="ctfa.prompt.message")
-            if isinstance(prompt, str)
-            else prompt
+            _parse_prompt(prompt).copy() if isinstance(prompt, str) else prompt
         )
         self.console = console or _console
 
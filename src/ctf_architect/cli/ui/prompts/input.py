@@ -1,18 +1,17 @@
 from __future__ import annotations
 
 import sys
+from functools import cached_property
 from typing import Any, Callable, Generic, TypeVar
 
 from rich.console import Console
 from rich.text import Text, TextType
 
-from ctf_architect.cli.ui.prompts.base import PromptBase
+from ctf_architect.cli.ui.prompts.base import PromptBase, render_header
 from ctf_architect.cli.ui.prompts.session import InvalidResponse, PromptSession
 
 InputType = TypeVar("InputType")
 
-NEWLINE_RESET = Text("\n", style="reset")
-
 
 class InputPromptBase(PromptBase, Generic[InputType]):
     response_type: type = str
@@ -107,7 +106,7 @@ class InputStr(InputPromptBase[str]):
         )
 
     def process_response(self, session: PromptSession, response: str) -> str:
-        if response == "" and self.default == ... and not self.allow_empty:
+        if not response.strip() and self.default == ... and not self.allow_empty:
             raise InvalidResponse("[ctfa.prompt.error]Please enter a value")
 
         return super().process_response(session, response)
@@ -140,37 +139,22 @@ class MultilineInput(PromptBase):
         self.prompt_suffix = prompt_suffix
         super().__init__(prompt, console=console)
 
-    def make_prompt(self, session: PromptSession) -> TextType:
-        if self.prompt.plain:
-            # prompt = (
-            #     self.prompt.copy()
-            #     .append(self.prompt_suffix)
-            #     .append("\n")
-            #     .append(self.helper_text, style="ctfa.prompt.message")
-            #     .append_text(NEWLINE_RESET)
-            # )
-            prompt = (
-                Text(self.helper_text, style="ctfa.prompt.message")
-                .append("\n")
-                .append_text(self.prompt.copy())
-                .append(self.prompt_suffix)
-                .append_text(NEWLINE_RESET)
-            )
-        else:
-            prompt = Text(self.helper_text, style="ctfa.prompt.message").append_text(
-                NEWLINE_RESET
-            )
-
-        prompt.end = ""
+    @cached_property
+    def _header(self) -> Text:
+        header = render_header(self.helper_text, self.prompt, self.prompt_suffix)
+        header.end = ""
+        return header
 
-        return prompt
+    def make_prompt(self, session: PromptSession) -> TextType:
+        # The header is built once and copied for every retry
+        return self._header.copy()
 
     def get_input(self, session: PromptSession, prompt: TextType | None = None) -> Any:
         session.console.print(prompt)
         return sys.stdin.read()
 
     def process_response(self, session: PromptSession, response: str) -> str:
-        if response == "" and not self.allow_empty:
+        if not response.strip() and not self.allow_empty:
             raise InvalidResponse("[ctfa.prompt.error]Please enter a value")
 
         if self.validator is not None:
@@ -33,8 +33,11 @@ class PromptSession:
         self.live = None
 
     def _run_static(self):
+        # Static prompts don't change between attempts, so render it only once
+        # instead of rebuilding it on every invalid response.
+        prompt = self.current_prompt.make_prompt(self)
+
         while True:
-            prompt = self.current_prompt.make_prompt(self)
             response = self.current_prompt.get_input(self, prompt)
 
             try:
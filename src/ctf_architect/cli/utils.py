@@ -1,23 +1,27 @@
 from __future__ import annotations
 
-import re
+import os
+import stat
 from pathlib import Path
 
-# from ctf_architect.cli.ui._filedialog import askdirectory, askopenfilename, askopenfilenames
+from rich.console import Group
+
 from ctf_architect.cli.ui.components import create_repo_config_panels
 from ctf_architect.cli.ui.console import console
 from ctf_architect.cli.ui.prompts import confirm, input_str, select
 from ctf_architect.cli.ui.prompts.session import InvalidResponse
 from ctf_architect.core.repo import load_repo_config
+from ctf_architect.models.challenge import sanitize_folder_name
 
 
 def ask_repo_config():
-    from ctf_architect.cli.ui._filedialog import askopenfilename
+    from ctf_architect.cli.ui._filedialog import askopenfilename, run_dialog
 
     while True:
         console.print("Please select the Repo Configuration file.", style="ctfa.info")
 
-        config_file_path = askopenfilename(
+        config_file_path = run_dialog(
+            askopenfilename,
             title="Select Repo Configuration file",
             filetypes=[("Repo Configuration file", "*.toml")],
         )
@@ -27,15 +31,18 @@ def ask_repo_config():
 
         config = load_repo_config(config_file_path)
 
-        for panel in create_repo_config_panels(
-            name=config.name,
-            flag_format=config.flag_format,
-            starting_port=config.starting_port,
-            categories=config.categories,
-            difficulties=config.difficulties,
-            extras=config.extras,
-        ):
-            console.print(panel)
+        console.print(
+            Group(
+                *create_repo_config_panels(
+                    name=config.name,
+                    flag_format=config.flag_format,
+                    starting_port=config.starting_port,
+                    categories=config.categories,
+                    difficulties=config.difficulties,
+                    extras=config.extras,
+                )
+            )
+        )
 
         if confirm("Is this the correct Repo Configuration?").execute():
             return config
@@ -45,50 +52,77 @@ def ask_repo_config():
 
 
 def valid_chall_name(name: str) -> bool:
-    return not not re.sub(r"^[^a-zA-Z]+|[^a-zA-Z0-9 _-]", "", name).strip()
+    return not not sanitize_folder_name(name)
+
+
+# Lowercase, as the names are matched case-insensitively
+SERVICE_FILE_NAMES = frozenset(
+    {
+        "dockerfile",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+        "compose.yml",
+        "compose.yaml",
+    }
+)
 
 
 def valid_service_folder(path: Path) -> bool:
-    if not path.is_dir() or not path.exists():
+    # Check if there is a Dockerfile or Docker Compose file in the folder,
+    # case-insensitive, in a single pass over the folder
+    try:
+        with os.scandir(path) as entries:
+            return any(
+                entry.name.lower() in SERVICE_FILE_NAMES and entry.is_file()
+                for entry in entries
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
-    # Check if there is a Dockerfile or docker-compose.yml in the folder, case-insensitive
-    return any(
-        file.name.lower()
-        in (
-            "dockerfile",
-            "docker-compose.yml",
-            "docker-compose.yaml",
-            "compose.yml",
-            "compose.yaml",
-        )
-        for file in path.iterdir()
-    )
 
+def _stat_path(response: str, kind: str) -> tuple[Path, int]:
+    """Stats a path entered by the user.
 
-def _validate_file_path(response: str):
+    A single stat call is used both to check that the path exists and to get its
+    file type.
+
+    Args:
+        response (str): The path entered by the user.
+        kind (str): What the path should point to, used in error messages.
+
+    Returns:
+        tuple[Path, int]: The path and its mode.
+
+    Raises:
+        InvalidResponse: If the path is invalid, does not exist or cannot be accessed.
+    """
     try:
         path = Path(response)
     except Exception:
-        raise InvalidResponse("[ctfa.prompt.error]Invalid file path.")
+        raise InvalidResponse(f"[ctfa.prompt.error]Invalid {kind.lower()} path.")
 
-    if not path.exists():
-        raise InvalidResponse("[ctfa.prompt.error]File does not exist.")
+    try:
+        return path, path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        raise InvalidResponse(f"[ctfa.prompt.error]{kind} does not exist.") from None
+    except OSError as e:
+        # e.g. a permission error, where the path may well exist
+        raise InvalidResponse(
+            f"[ctfa.prompt.error]Unable to access {kind.lower()}: {e.strerror}."
+        ) from None
+
+
+def _validate_file_path(response: str):
+    _, mode = _stat_path(response, "File")
 
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         raise InvalidResponse("[ctfa.prompt.error]Path is not a file.")
 
 
 def _validate_service_folder_path(response: str):
-    try:
-        path = Path(response)
-    except Exception:
-        raise InvalidResponse("[ctfa.prompt.error]Invalid folder path.")
+    path, mode = _stat_path(response, "Folder")
 
-    if not path.exists():
-        raise InvalidResponse("[ctfa.prompt.error]Folder does not exist.")
-
-    if not path.is_dir():
+    if not stat.S_ISDIR(mode):
         raise InvalidResponse("[ctfa.prompt.error]Path is not a folder.")
 
     if not valid_service_folder(path):
@@ -98,29 +132,34 @@ def _validate_service_folder_path(response: str):
 
 
 def ask_dist_files() -> list[Path | str]:
-    from ctf_architect.cli.ui._filedialog import askopenfilenames
+    from ctf_architect.cli.ui._filedialog import askopenfilenames, run_dialog
 
     files = []
 
+    file_type_select = select(
+        choices=["Local file", "URL", "Done"],
+        prompt="Select the type of files to add",
+    )
+    input_method_select = select(
+        choices=["Manually enter path", "Browse for file"],
+        prompt="How would you like to select the file?",
+    )
+    file_path_input = input_str(
+        ":file_folder: Enter the path to the file",
+        allow_empty=False,
+        validator=_validate_file_path,
+    )
+    url_input = input_str(":file_folder: Enter the URL of the file", allow_empty=False)
+
     while True:
-        file_type = select(
-            choices=["Local file", "URL", "Done"],
-            prompt="Select the type of files to add",
-        ).execute()
+        file_type = file_type_select.execute()
 
         if file_type == "Local file":
-            input_method = select(
-                choices=["Manually enter path", "Browse for file"],
-                prompt="How would you like to select the file?",
-            ).execute()
+            input_method = input_method_select.execute()
 
             if input_method == "Manually enter path":
                 try:
-                    file_path = input_str(
-                        ":file_folder: Enter the path to the file",
-                        allow_empty=False,
-                        validator=_validate_file_path,
-                    ).execute()
+                    file_path = file_path_input.execute()
                 except KeyboardInterrupt:
                     continue
 
@@ -128,22 +167,22 @@ def ask_dist_files() -> list[Path | str]:
 
                 console.print(f"Added file: {file_path}", style="ctfa.success")
             else:
-                file_paths = askopenfilenames(
-                    title="Select the dist files for the challenge"
+                file_paths = run_dialog(
+                    askopenfilenames, title="Select the dist files for the challenge"
                 )
-                if file_paths == "":
+                if not file_paths:
                     # User cancelled or dialog is unsupported
                     continue
 
+                added = []
                 for file_path in file_paths:
                     files.append(Path(file_path))
+                    added.append(f"Added file: {file_path}")
 
-                    console.print(f"Added file: {file_path}", style="ctfa.success")
+                console.print("\n".join(added), style="ctfa.success")
         elif file_type == "URL":
             # TODO: Add URL validation
-            url = input_str(
-                ":file_folder: Enter the URL of the file", allow_empty=False
-            ).execute()
+            url = url_input.execute()
             files.append(url)
 
             console.print(f"Added URL: {url}", style="ctfa.success")
@@ -160,23 +199,26 @@ def ask_dist_files() -> list[Path | str]:
 
 
 def ask_source_files() -> list[Path]:
-    from ctf_architect.cli.ui._filedialog import askopenfilename
+    from ctf_architect.cli.ui._filedialog import askopenfilename, run_dialog
 
     files = []
 
+    input_method_select = select(
+        choices=["Manually enter path", "Browse for file", "Done"],
+        prompt="How would you like to select the file?",
+    )
+    file_path_input = input_str(
+        ":file_folder: Enter the path to the file",
+        allow_empty=False,
+        validator=_validate_file_path,
+    )
+
     while True:
-        input_method = select(
-            choices=["Manually enter path", "Browse for file", "Done"],
-            prompt="How would you like to select the file?",
-        ).execute()
+        input_method = input_method_select.execute()
 
         if input_method == "Manually enter path":
             try:
-                file_path = input_str(
-                    ":file_folder: Enter the path to the file",
-                    allow_empty=False,
-                    validator=_validate_file_path,
-                ).execute()
+                file_path = file_path_input.execute()
             except KeyboardInterrupt:
                 continue
 
@@ -184,8 +226,8 @@ def ask_source_files() -> list[Path]:
 
             console.print(f"Added file: {file_path}", style="ctfa.success")
         elif input_method == "Browse for file":
-            file_path = askopenfilename(
-                title="Select the source file for the challenge"
+            file_path = run_dialog(
+                askopenfilename, title="Select the source file for the challenge"
             )
             if file_path == "":
                 # User cancelled or dialog is unsupported
@@ -207,23 +249,26 @@ def ask_source_files() -> list[Path]:
 
 
 def ask_solution_files() -> list[Path]:
-    from ctf_architect.cli.ui._filedialog import askopenfilename
+    from ctf_architect.cli.ui._filedialog import askopenfilename, run_dialog
 
     files = []
 
+    input_method_select = select(
+        choices=["Manually enter path", "Browse for file", "Done"],
+        prompt="How would you like to select the file?",
+    )
+    file_path_input = input_str(
+        ":file_folder: Enter the path to the file",
+        allow_empty=False,
+        validator=_validate_file_path,
+    )
+
     while True:
-        input_method = select(
-            choices=["Manually enter path", "Browse for file", "Done"],
-            prompt="How would you like to select the file?",
-        ).execute()
+        input_method = input_method_select.execute()
 
         if input_method == "Manually enter path":
             try:
-                file_path = input_str(
-                    ":file_folder: Enter the path to the file",
-                    allow_empty=False,
-                    validator=_validate_file_path,
-                ).execute()
+                file_path = file_path_input.execute()
             except KeyboardInterrupt:
                 continue
 
@@ -231,8 +276,8 @@ def ask_solution_files() -> list[Path]:
 
             console.print(f"Added file: {file_path}", style="ctfa.success")
         elif input_method == "Browse for file":
-            file_path = askopenfilename(
-                title="Select the solution file for the challenge"
+            file_path = run_dialog(
+                askopenfilename, title="Select the solution file for the challenge"
             )
             if file_path == "":
                 # User cancelled or dialog is unsupported
@@ -254,23 +299,26 @@ def ask_solution_files() -> list[Path]:
 
 
 def ask_service_folder() -> Path | None:
-    from ctf_architect.cli.ui._filedialog import askdirectory
+    from ctf_architect.cli.ui._filedialog import askdirectory, run_dialog
 
     folder = None
 
+    input_method_select = select(
+        choices=["Manually enter path", "Browse for folder", "Cancel"],
+        prompt="How would you like to select the folder?",
+    )
+    folder_path_input = input_str(
+        ":file_folder: Enter the path to the folder",
+        allow_empty=False,
+        validator=_validate_service_folder_path,
+    )
+
     while True:
-        input_method = select(
-            choices=["Manually enter path", "Browse for folder", "Cancel"],
-            prompt="How would you like to select the folder?",
-        ).execute()
+        input_method = input_method_select.execute()
 
         if input_method == "Manually enter path":
             try:
-                folder_path = input_str(
-                    ":file_folder: Enter the path to the folder",
-                    allow_empty=False,
-                    validator=_validate_service_folder_path,
-                ).execute()
+                folder_path = folder_path_input.execute()
             except KeyboardInterrupt:
                 continue
 
@@ -281,7 +329,9 @@ def ask_service_folder() -> Path | None:
 
         if input_method == "Browse for folder":
             while True:
-                folder_path = askdirectory(title="Select the service folder")
+                folder_path = run_dialog(
+                    askdirectory, title="Select the service folder"
+                )
 
                 if folder_path == "":
                     # User cancelled or dialog is unsupported
@@ -4,10 +4,8 @@ import re
 
 from ctf_architect.cli.ui.prompts import InvalidResponse
 
-
-def no_empty_string(response: str) -> None:
-    if len(response) == 0:
-        raise InvalidResponse("[ctfa.prompt.error]Please enter a value")
+_CHALL_FOLDER_NAME_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9 _-]*$")
+_SERVICE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_-]*$")
 
 
 def valid_port(port: int) -> None:
@@ -16,14 +14,14 @@ def valid_port(port: int) -> None:
 
 
 def valid_chall_folder_name(folder_name: str) -> None:
-    if folder_name and not re.match(r"^[a-zA-Z][a-zA-Z0-9 _-]*$", folder_name):
+    if folder_name and not _CHALL_FOLDER_NAME_PATTERN.match(folder_name):
         raise InvalidResponse(
             "[ctfa.prompt.error]Invalid challenge folder name. Folder name must start with a letter and contain only letters, numbers, spaces, underscores and hyphens."
         )
 
 
 def valid_service_name(service_name: str) -> None:
-    if not re.match(r"^[a-z][a-z0-9_-]*$", service_name):
+    if not _SERVICE_NAME_PATTERN.match(service_name):
         raise InvalidResponse(
             "[ctfa.prompt.error]Invalid service name. Service name must start with a lowercase letter and contain only lowercase letters, numbers, underscores and hyphens."
         )
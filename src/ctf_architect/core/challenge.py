@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import tomllib
+from functools import lru_cache
 from pathlib import Path
 
-from tomlkit import comment, document, dump, load, nl
+import tomli_w
 
 from ctf_architect.constants import CHALLENGE_CONFIG_FILE, CHALLENGE_CONFIG_HEADER
 from ctf_architect.models.challenge import Challenge, ChallengeFile
@@ -22,11 +25,32 @@ def is_challenge_folder(path: str | Path) -> bool:
     Returns:
         bool: True if the folder is a challenge folder, False otherwise.
     """
-    for file in Path(path).iterdir():
-        if file.name.lower() == CHALLENGE_CONFIG_FILE:
-            return True
+    path = Path(path).absolute()
 
-    return False
+    stat = path.stat()
+
+    return _is_challenge_folder(path, stat.st_mtime_ns, stat.st_ino)
+
+
+@lru_cache(maxsize=1024)
+def _is_challenge_folder(path: Path, mtime_ns: int, ino: int) -> bool:
+    """Scans the folder at the given path for a Challenge Config file.
+
+    Linting and stats check every folder in the repository, so the result is cached.
+    The folder's modification time, which changes whenever a file is added, removed
+    or renamed in it, and its inode are part of the cache key, so the folder is
+    scanned again if it is changed or replaced.
+
+    Args:
+        path (Path): The absolute path to the folder.
+        mtime_ns (int): The modification time of the folder in nanoseconds.
+        ino (int): The inode number of the folder.
+
+    Returns:
+        bool: True if the folder is a challenge folder, False otherwise.
+    """
+    with os.scandir(path) as entries:
+        return any(entry.name.lower() == CHALLENGE_CONFIG_FILE for entry in entries)
 
 
 def load_chall_config(path: str | Path) -> Challenge:
@@ -38,13 +62,38 @@ def load_chall_config(path: str | Path) -> Challenge:
     Returns:
         Challenge: The challenge config.
     """
-    if isinstance(path, str):
-        path = Path(path)
+    # An absolute path is enough for the cache key, and unlike resolving the path it
+    # does not need to stat every component of it
+    config_path = os.path.abspath(os.path.join(path, CHALLENGE_CONFIG_FILE))
 
-    with open(path / CHALLENGE_CONFIG_FILE, "r", encoding="utf-8") as f:
-        data = load(f)
+    stat = os.stat(config_path)
 
-    config_file = ChallengeFile.model_validate(data.unwrap())
+    return _load_chall_config_file(
+        config_path, stat.st_mtime_ns, stat.st_size, stat.st_ino
+    )
+
+
+@lru_cache(maxsize=256)
+def _load_chall_config_file(path: str, mtime_ns: int, size: int, ino: int) -> Challenge:
+    """Parses the challenge config file at the given path.
+
+    Lint rules each load the challenge config, so the parsed config is cached. The
+    file's modification time, size and inode are part of the cache key, so the file
+    is parsed again if it is edited in place or atomically replaced.
+
+    Args:
+        path (str): The absolute path to the challenge config file.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+        ino (int): The inode number of the file.
+
+    Returns:
+        Challenge: The challenge config.
+    """
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+
+    config_file = ChallengeFile.model_validate(data)
 
     return config_file.challenge
 
@@ -59,18 +108,20 @@ def save_chall_config(path: str | Path, challenge: Challenge) -> None:
     if isinstance(path, str):
         path = Path(path)
 
-    doc = document()
-
-    for line in CHALLENGE_CONFIG_HEADER.splitlines():
-        doc.add(comment(line))
-    doc.add(nl())
-
-    doc.add("version", str(CHALLENGE_SPEC_VERSION))
+    # The file is machine generated, so there is no formatting to preserve and the
+    # much faster tomli_w can be used instead of building a tomlkit document
+    header = "".join(f"# {line}\n" for line in CHALLENGE_CONFIG_HEADER.splitlines())
 
-    doc.add("challenge", challenge.model_dump(mode="json", exclude_defaults=True))
+    data = {
+        "version": str(CHALLENGE_SPEC_VERSION),
+        "challenge": challenge.model_dump(mode="json", exclude_defaults=True),
+    }
 
-    with open(path / CHALLENGE_CONFIG_FILE, "w", encoding="utf-8") as f:
-        dump(doc, f)
+    # Rendered into one buffer so the file is written in a single call. Bytes are
+    # written so that newlines are not translated on Windows, as tomli_w.dump does
+    (path / CHALLENGE_CONFIG_FILE).write_bytes(
+        f"{header}\n{tomli_w.dumps(data)}".encode()
+    )
 
 
 def save_chall_readme(path: str | Path, challenge: Challenge) -> None:
@@ -13,6 +13,13 @@ from ctf_architect.core.repo import walk_challenges
 from ctf_architect.models.challenge import Service
 from ctf_architect.models.port_mapping import PortMapping
 
+# Use the libyaml emitter when PyYAML was built with it, it is much faster than the
+# pure Python one
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
 
 def get_compose_file_path(path: Path) -> Path | None:
     """
@@ -46,13 +53,31 @@ def _construct_port_overrides(
     return _PortOverrides(loader.construct_sequence(node))
 
 
-def _represent_port_overrides(dumper: yaml.SafeDumper, data: _PortOverrides):
+def _represent_port_overrides(dumper: _SafeDumper, data: _PortOverrides):
     return dumper.represent_sequence("!override", data)
 
 
 # TODO: Maybe make a custom instance for this
 yaml.add_constructor("!override", _construct_port_overrides, Loader=yaml.SafeLoader)  # type: ignore
-yaml.add_representer(_PortOverrides, _represent_port_overrides, Dumper=yaml.SafeDumper)
+yaml.add_representer(_PortOverrides, _represent_port_overrides, Dumper=_SafeDumper)
+
+
+def _format_ports(port_mappings: list[PortMapping]) -> list[str]:
+    """Formats port mappings as Compose port strings.
+
+    Args:
+        port_mappings: The list of port mappings for the service
+
+    Returns:
+        The "host:container" port strings, or just the container port if it is not
+        mapped to a host port
+    """
+    return [
+        f"{mapping.from_port}"
+        if mapping.to_port is None
+        else f"{mapping.to_port}:{mapping.from_port}"
+        for mapping in port_mappings
+    ]
 
 
 def create_compose_service(
@@ -84,22 +109,16 @@ def create_compose_service(
         "restart": "always",
     }
 
-    ports = []
-
-    for mapping in port_mappings:
-        if mapping.to_port is not None:
-            ports.append(f"{mapping.to_port}:{mapping.from_port}")
-        else:
-            ports.append(f"{mapping.from_port}")
+    ports = _format_ports(port_mappings)
 
     if ports:
         compose_service["ports"] = ports
 
     extras = service.extras if service.extras is not None else {}
 
-    for key in extras:
+    for key, value in extras.items():
         if key == "restart" or key not in compose_service:
-            compose_service[key] = extras[key]
+            compose_service[key] = value
 
     return compose_service
 
@@ -123,13 +142,7 @@ def create_compose_service_override(
 
     compose_service = {**extras}
 
-    ports = _PortOverrides()
-
-    for mapping in port_mappings:
-        if mapping.to_port is not None:
-            ports.append(f"{mapping.to_port}:{mapping.from_port}")
-        else:
-            ports.append(f"{mapping.from_port}")
+    ports = _PortOverrides(_format_ports(port_mappings))
 
     if ports:
         compose_service["ports"] = ports
@@ -212,11 +225,11 @@ def create_compose_files() -> None:
     compose, override = create_compose_dicts()
 
     with open("compose.yml", "w") as file:
-        yaml.dump(compose, file)
+        yaml.dump(compose, file, Dumper=_SafeDumper)
 
     if override is not None:
         with open("compose.override.yml", "w") as file:
-            yaml.dump(override, file)
+            yaml.dump(override, file, Dumper=_SafeDumper)
 
 
 def update_compose_files() -> None:
@@ -253,8 +266,8 @@ def update_compose_files() -> None:
             overrides["services"].update(new_overrides["services"])
 
     with open("compose.yml", "w") as f:
-        yaml.safe_dump(compose, f)
+        yaml.dump(compose, f, Dumper=_SafeDumper)
 
     if overrides is not None:
         with open("compose.override.yml", "w") as f:
-            yaml.safe_dump(overrides, f)
+            yaml.dump(overrides, f, Dumper=_SafeDumper)
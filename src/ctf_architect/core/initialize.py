@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import shutil
+import stat
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Literal, TypedDict
 
+from pydantic import TypeAdapter
+
 from ctf_architect.core.challenge import save_chall_config, save_chall_readme
 from ctf_architect.core.repo import load_repo_config, save_repo_config
 from ctf_architect.core.stats import update_category_readme, update_root_readme
 from ctf_architect.models.challenge import Challenge, Flag, Hint, Service
 from ctf_architect.models.ctf_config import CTFConfig, ExtraField
 
+# Validating a whole list in one call avoids going through model_validate per item
+_FLAGS_ADAPTER = TypeAdapter(list[Flag])
+_HINTS_ADAPTER = TypeAdapter(list[Hint])
+_SERVICES_ADAPTER = TypeAdapter(list[Service])
+
 
 class ExtraFieldDict(TypedDict):
     """Extra field dictionary type.
@@ -69,19 +79,7 @@ def init_repo_no_config(
     save_repo_config(ctf_config)
 
     if not config_only:
-        # Create the challenge folder
-        Path("challenges").mkdir(exist_ok=True)
-
-        # Create the folders for each category
-        for category in categories:
-            Path(f"challenges/{category.lower()}").mkdir(exist_ok=True)
-
-        # Update the root README
-        update_root_readme()
-
-        # Update the README for each category
-        for category in categories:
-            update_category_readme(category)
+        _create_repo_folders(categories)
 
 
 def init_repo_from_config() -> None:
@@ -89,18 +87,33 @@ def init_repo_from_config() -> None:
 
     config = load_repo_config()
 
-    # Create the challenge folder
-    Path("challenges").mkdir(exist_ok=True)
+    _create_repo_folders(config.categories)
+
 
-    # Create the folders for each category
-    for category in config.categories:
-        Path(f"challenges/{category.lower()}").mkdir(exist_ok=True)
+def _create_repo_folders(categories: list[str]) -> None:
+    """Creates the challenges folder with a folder and README for each category.
+
+    Args:
+        categories (list[str]): The categories of the CTF.
+    """
+    challenges_path = Path("challenges")
+
+    # When re-initialising a repository the folders usually exist already, so check
+    # first rather than having mkdir raise and swallow FileExistsError each time
+    if categories:
+        # The category folders are created together with the challenges folder
+        for category in categories:
+            category_path = challenges_path / category.lower()
+            if not category_path.is_dir():
+                category_path.mkdir(parents=True, exist_ok=True)
+    elif not challenges_path.is_dir():
+        challenges_path.mkdir(exist_ok=True)
 
     # Update the root README
     update_root_readme()
 
     # Update the README for each category
-    for category in config.categories:
+    for category in categories:
         update_category_readme(category)
 
 
@@ -125,6 +138,100 @@ class ServiceDict(TypedDict):
     extras: dict[str, str | int | float | bool] | None
 
 
+def _check_file(file: Path) -> None:
+    """Checks that a challenge file exists and is a regular file.
+
+    A single stat call is used for both checks.
+
+    Args:
+        file (Path): The path to the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        IsADirectoryError: If the path is not a regular file.
+    """
+    try:
+        mode = file.stat().st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f'File "{file}" does not exist.') from None
+
+    if not stat.S_ISREG(mode):
+        raise IsADirectoryError(f'"{file}" is a directory.')
+
+
+def _check_unique_names(paths: list[Path], folder: str) -> None:
+    """Checks that no two paths would be copied to the same place in a folder.
+
+    The copies into a folder run concurrently, so two paths with the same name would
+    race to write the same destination.
+
+    Args:
+        paths (list[Path]): The paths to be copied into the folder.
+        folder (str): The name of the folder in the challenge, used in the error.
+
+    Raises:
+        ValueError: If more than one path has the same name.
+    """
+    names = set()
+
+    for path in paths:
+        if path.name in names:
+            raise ValueError(
+                f'More than one file or folder named "{path.name}" would be copied to {folder}/.'
+            )
+        names.add(path.name)
+
+
+def _ignore_staging_folder(
+    staging_path: Path,
+) -> Callable[[str, list[str]], set[str]]:
+    """Creates a copytree ignore function that skips the staging folder.
+
+    If the challenge is created from inside a service folder, the staging folder is
+    inside that service folder too, and would otherwise be copied into itself.
+
+    Args:
+        staging_path (Path): The path to the staging folder.
+
+    Returns:
+        Callable[[str, list[str]], set[str]]: The ignore function for copytree.
+    """
+    staging_path = staging_path.resolve()
+
+    def ignore(directory: str, names: list[str]) -> set[str]:
+        # Only resolve the directory if it could contain the staging folder
+        if staging_path.name not in names:
+            return set()
+
+        if Path(directory).resolve() != staging_path.parent:
+            return set()
+
+        return {staging_path.name}
+
+    return ignore
+
+
+def _check_service_folder(folder: Path) -> None:
+    """Checks that a service folder exists and is a directory.
+
+    A single stat call is used for both checks.
+
+    Args:
+        folder (Path): The path to the service folder.
+
+    Raises:
+        FileNotFoundError: If the folder does not exist.
+        NotADirectoryError: If the path is not a directory.
+    """
+    try:
+        mode = folder.stat().st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f'Service folder "{folder}" does not exist.') from None
+
+    if not stat.S_ISDIR(mode):
+        raise NotADirectoryError(f'"{folder}" is not a directory.')
+
+
 def init_chall(
     author: str,
     category: str,
@@ -174,32 +281,58 @@ def init_chall(
         else:
             target_dir.mkdir()
 
-    _flags = [Flag.model_validate(flag) for flag in flags]
+    _flags = _FLAGS_ADAPTER.validate_python(flags)
 
     if hints is None:
         _hints = None
     else:
-        _hints = [Hint.model_validate(hint) for hint in hints]
+        _hints = _HINTS_ADAPTER.validate_python(hints)
 
-    with TemporaryDirectory() as temp_dir:
+    if services is None:
+        _services = None
+    else:
+        _services = _SERVICES_ADAPTER.validate_python(services)
+
+    # Check for clashing names before anything is copied
+    if dist_files is not None:
+        _check_unique_names([f for f in dist_files if isinstance(f, Path)], "dist")
+    if source_files is not None:
+        _check_unique_names(source_files, "src")
+    if solution_files is not None:
+        _check_unique_names(solution_files, "solution")
+    if _services is not None:
+        _check_unique_names([_service.path for _service in _services], "service")
+
+    # Stage the challenge next to where it will end up, rather than in the system
+    # temp dir, so that the final move is a rename on the same filesystem instead of
+    # a copy of every file. The staging folder is hidden (.ctfa-*), and is removed
+    # afterwards unless the process is killed mid-way.
+    staging_dir = Path.cwd() if target_dir is None else target_dir
+
+    with (
+        TemporaryDirectory(prefix=".ctfa-", dir=staging_dir) as temp_dir,
+        ThreadPoolExecutor() as executor,
+    ):
         temp_path = Path(temp_dir)
 
+        # File copies are run in the background so that large attachments are
+        # copied concurrently, and overlap with writing the challenge config.
+        copies: list[Future] = []
+
         if dist_files is not None:
             (temp_path / "dist").mkdir()
 
             _files = []
             for file in dist_files:
                 if isinstance(file, Path):
-                    if not file.exists():
-                        raise FileNotFoundError(f'File "{file}" does not exist.')
+                    _check_file(file)
 
-                    if not file.is_file():
-                        raise IsADirectoryError(f'"{file}" is a directory.')
+                    dist_path = Path("dist", file.name)
 
-                    shutil.copy(file, temp_path / "dist")
-                    _files.append(
-                        (temp_path / "dist" / file.name).relative_to(temp_path)
+                    copies.append(
+                        executor.submit(shutil.copy, file, temp_path / dist_path)
                     )
+                    _files.append(dist_path)
                 else:
                     # TODO: Validate the URL
                     _files.append(file)
@@ -210,13 +343,11 @@ def init_chall(
             (temp_path / "src").mkdir()
 
             for file in source_files:
-                if not file.exists():
-                    raise FileNotFoundError(f'File "{file}" does not exist.')
+                _check_file(file)
 
-                if not file.is_file():
-                    raise IsADirectoryError(f'"{file}" is a directory.')
-
-                shutil.copy(file, temp_path / "src")
+                copies.append(
+                    executor.submit(shutil.copy, file, temp_path / "src" / file.name)
+                )
 
         (temp_path / "solution").mkdir()
 
@@ -226,13 +357,13 @@ def init_chall(
             create_writeup_md = True
 
             for file in solution_files:
-                if not file.exists():
-                    raise FileNotFoundError(f'File "{file}" does not exist.')
+                _check_file(file)
 
-                if not file.is_file():
-                    raise IsADirectoryError(f'"{file}" is a directory.')
-
-                shutil.copy(file, temp_path / "solution")
+                copies.append(
+                    executor.submit(
+                        shutil.copy, file, temp_path / "solution" / file.name
+                    )
+                )
 
                 if file.name == "writeup.md":
                     create_writeup_md = False
@@ -240,31 +371,23 @@ def init_chall(
             if create_writeup_md:
                 (temp_path / "solution" / "writeup.md").touch()
 
-        if services is not None:
+        if _services is not None:
             (temp_path / "service").mkdir()
 
-            _services = []
-            for service in services:
-                _service = Service.model_validate(service)
+            for _service in _services:
+                _check_service_folder(_service.path)
 
-                if not _service.path.exists():
-                    raise FileNotFoundError(
-                        f'Service folder "{_service.path}" does not exist.'
-                    )
+                service_path = Path("service", _service.path.name)
 
-                if not _service.path.is_dir():
-                    raise NotADirectoryError(f'"{_service.path}" is not a directory.')
-
-                shutil.copytree(
-                    _service.path, temp_path / "service" / _service.path.name
+                copies.append(
+                    executor.submit(
+                        shutil.copytree,
+                        _service.path,
+                        temp_path / service_path,
+                        ignore=_ignore_staging_folder(temp_path),
+                    )
                 )
-                _service.path = (
-                    temp_path / "service" / _service.path.name
-                ).relative_to(temp_path)
-
-                _services.append(_service)
-        else:
-            _services = None
+                _service.path = service_path
 
         kwargs = {
             "author": author,
@@ -288,7 +411,14 @@ def init_chall(
         save_chall_config(temp_path, chall)
         save_chall_readme(temp_path, chall)
 
-        if target_dir is None:
-            target_dir = Path(chall.folder_name)
+        # Wait for all copies to finish, re-raising any errors
+        for copy in copies:
+            copy.result()
 
-        shutil.move(temp_path, target_dir)
+        if target_dir is None:
+            shutil.move(temp_path, chall.folder_name)
+        else:
+            # The target directory already exists, so move the contents into it
+            # instead of moving the staging directory inside it
+            for entry in temp_path.iterdir():
+                entry.rename(target_dir / entry.name)
@@ -1,12 +1,13 @@
 """Functions for repository-level operations."""
 
-import re
+import os
 import shutil
+import tomllib
 from collections.abc import Generator
 from functools import lru_cache
 from pathlib import Path
 
-from tomlkit import comment, document, dump, load, nl
+from tomlkit import comment, document, dump, nl
 
 from ctf_architect.constants import CTF_CONFIG_FILE, CTF_CONFIG_HEADER
 from ctf_architect.core.challenge import is_challenge_folder, load_chall_config
@@ -17,7 +18,7 @@ from ctf_architect.core.exceptions import (
     InvalidChallengeFolderError,
     NotInChallengeRepositoryError,
 )
-from ctf_architect.models.challenge import Challenge
+from ctf_architect.models.challenge import Challenge, sanitize_folder_name
 from ctf_architect.models.ctf_config import ConfigFile, CTFConfig
 from ctf_architect.version import CTF_CONFIG_SPEC_VERSION
 
@@ -49,7 +50,6 @@ def is_challenge_repo(path: str | Path | None = None) -> bool:
     return False
 
 
-@lru_cache
 def load_repo_config(path: str | Path | None = None) -> CTFConfig:
     """Loads the CTF config file from the given path.
 
@@ -70,9 +70,6 @@ def load_repo_config(path: str | Path | None = None) -> CTFConfig:
     elif isinstance(path, str):
         path = Path(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Could not find {CTF_CONFIG_FILE} in {path}")
-
     if path.is_dir():
         # If path is a valid repo, load the CTF config file from the directory
         if is_challenge_repo(path):
@@ -81,13 +78,42 @@ def load_repo_config(path: str | Path | None = None) -> CTFConfig:
             raise NotInChallengeRepositoryError(
                 f'"{path.resolve()}" is not a challenge repository'
             )
-    else:
+    elif path.exists():
         ctf_config_file = path
+    else:
+        raise FileNotFoundError(f"Could not find {CTF_CONFIG_FILE} in {path}")
+
+    # Key the cache on a plain absolute path string, so that str and Path arguments
+    # share entries without having to resolve the path
+    config_path = os.path.abspath(ctf_config_file)
+
+    stat = os.stat(config_path)
+
+    return _load_repo_config_file(
+        config_path, stat.st_mtime_ns, stat.st_size, stat.st_ino
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_repo_config_file(path: str, mtime_ns: int, size: int, ino: int) -> CTFConfig:
+    """Parses the CTF config file at the given path.
+
+    The file's modification time, size and inode are part of the cache key, so the
+    file is parsed again if it is edited in place or atomically replaced.
+
+    Args:
+        path (str): The absolute path to the CTF config file.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+        ino (int): The inode number of the file.
 
-    with open(ctf_config_file, "r", encoding="utf-8") as f:
-        data = load(f)
+    Returns:
+        CTFConfig: The CTF config object.
+    """
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
 
-    config_file = ConfigFile.model_validate(data.unwrap())
+    config_file = ConfigFile.model_validate(data)
 
     return config_file.config
 
@@ -163,7 +189,7 @@ def find_challenge_folder(name: str, verify: bool = True) -> Path | None:
 
     folders = walk_challenge_folders(ignore_invalid=True)
 
-    folder_name = re.sub(r"^[^a-zA-Z]+|[^a-zA-Z0-9 _-]", "", name).strip()
+    folder_name = sanitize_folder_name(name)
 
     for folder in folders:
         if folder_name.lower() in folder.name.lower():
@@ -191,30 +217,20 @@ def find_challenge(name: str) -> Challenge | None:
     # 1. Search by the folder name, if match found, check challenge config file to verify
     # 2. Search every challenge config file for a name match
 
-    folders = walk_challenge_folders(ignore_invalid=True)
+    folder_name = sanitize_folder_name(name).lower()
+    name = name.lower()
 
-    searched = set()
-
-    # TODO: Maybe convert this to a function
-    folder_name = re.sub(r"^[^a-zA-Z]+|[^a-zA-Z0-9 _-]", "", name).strip()
+    # Sorting is stable, so this visits the folders matching the folder name first
+    # and then every other folder, each exactly once
+    folders = sorted(
+        walk_challenge_folders(ignore_invalid=True),
+        key=lambda folder: folder_name not in folder.name.lower(),
+    )
 
     for folder in folders:
-        if folder_name.lower() in folder.name.lower():
-            searched.add(folder)
-            try:
-                challenge = load_chall_config(folder)
-                if challenge.name.lower() == name.lower():
-                    return challenge
-            except Exception:
-                pass
-
-    for folder in folders:
-        if folder in searched:
-            continue
-
         try:
             challenge = load_chall_config(folder)
-            if challenge.name.lower() == name.lower():
+            if challenge.name.lower() == name:
                 return challenge
         except Exception:
             pass
@@ -318,8 +334,9 @@ def remove_challenge(
             folder = Path(folder)
         if not folder.is_dir():
             raise NotADirectoryError(f'"{folder.absolute()}" is not a directory')
-        # Safety check to make sure path is in the challenge repo
-        if folder.resolve().parent not in Path("challenges").resolve().iterdir():
+        # Safety check to make sure path is in the challenge repo, i.e. that it is
+        # in a category folder directly under challenges/
+        if folder.resolve().parent.parent != Path("challenges").resolve():
             raise NotInChallengeRepositoryError(
                 f'"{folder.absolute()}" is not in the CTF repo'
             )
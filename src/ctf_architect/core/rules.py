@@ -166,10 +166,9 @@ def C003(challenge_path: Path, ctf_config: CTFConfig) -> Literal[True] | str:
             missing_extras.append(extra)
 
     if missing_extras:
-        result = f"Missing extras in {CHALLENGE_CONFIG_FILE} file:\n"
-        for extra in missing_extras:
-            result += f"  - {extra.name} ({extra.description})\n"
-        return result.rstrip()
+        return f"Missing extras in {CHALLENGE_CONFIG_FILE} file:\n" + "\n".join(
+            f"  - {extra.name} ({extra.description})" for extra in missing_extras
+        )
     else:
         return True
 
@@ -194,10 +193,9 @@ def C004(challenge_path: Path, ctf_config: CTFConfig) -> Literal[True] | str:
             extra_extras.append(extra)
 
     if extra_extras:
-        result = f"Extra extras in {CHALLENGE_CONFIG_FILE} file:\n"
-        for extra in extra_extras:
-            result += f"  - {extra}\n"
-        return result.rstrip()
+        return f"Extra extras in {CHALLENGE_CONFIG_FILE} file:\n" + "\n".join(
+            f"  - {extra}" for extra in extra_extras
+        )
     else:
         return True
 
@@ -229,10 +227,10 @@ def C005(challenge_path: Path, ctf_config: CTFConfig) -> Literal[True] | str:
                 incorrect_extras.append(extra)
 
     if incorrect_extras:
-        result = f"Incorrect extra types in {CHALLENGE_CONFIG_FILE} file:\n"
-        for extra in incorrect_extras:
-            result += f"  - {extra.name} (expected {extra.type}, got {type(challenge_extras[extra.name])})\n"
-        return result.rstrip()
+        return f"Incorrect extra types in {CHALLENGE_CONFIG_FILE} file:\n" + "\n".join(
+            f"  - {extra.name} (expected {extra.type}, got {type(challenge_extras[extra.name])})"
+            for extra in incorrect_extras
+        )
     else:
         return True
 
@@ -259,21 +257,21 @@ def C006(challenge_path: Path) -> Literal[True] | str:
             if not (challenge_path / file).exists():
                 missing_files.append(file)
 
-    result = ""
+    sections = []
 
     if absolute_files:
-        s = "Files specified in chall.toml are absolute paths:\n"
-        for file in absolute_files:
-            s += f"  - {file}\n"
-        result += s
+        sections.append(
+            "Files specified in chall.toml are absolute paths:\n"
+            + "\n".join(f"  - {file}" for file in absolute_files)
+        )
 
     if missing_files:
-        s = "Files specified in chall.toml do not exist:\n"
-        for file in missing_files:
-            s += f"  - {file}\n"
-        result += s
+        sections.append(
+            "Files specified in chall.toml do not exist:\n"
+            + "\n".join(f"  - {file}" for file in missing_files)
+        )
 
-    return result.rstrip() if result else True
+    return "\n".join(sections) if sections else True
 
 
 @rule(
@@ -316,17 +314,18 @@ def C008(
             message="No flags in challenge",
         )
 
+    flag_format = re.compile(ctf_config.flag_format)
     invalid_flags = []
 
     for flag in challenge.flags:
-        if not re.match(ctf_config.flag_format, flag.flag):
+        if not flag_format.match(flag.flag):
             invalid_flags.append(flag.flag)
 
     if invalid_flags:
-        result = f'Flags do not match the flag format "{ctf_config.flag_format}":\n'
-        for flag in invalid_flags:
-            result += f"  - {flag}\n"
-        return result.rstrip()
+        return (
+            f'Flags do not match the flag format "{ctf_config.flag_format}":\n'
+            + "\n".join(f"  - {flag}" for flag in invalid_flags)
+        )
     else:
         return True
 
@@ -384,10 +383,10 @@ def C011(challenge_path: Path) -> Literal[True] | str | CheckResult:
                 missing_requirements.append(req)
 
     if missing_requirements:
-        result = "Requirements in chall.toml file could not be found or loaded:\n"
-        for req in missing_requirements:
-            result += f"  - {req}\n"
-        return result.rstrip()
+        return (
+            "Requirements in chall.toml file could not be found or loaded:\n"
+            + "\n".join(f"  - {req}" for req in missing_requirements)
+        )
     else:
         return True
 
@@ -418,18 +417,18 @@ def S000(challenge_path: Path) -> Literal[True] | str | CheckResult:
         if not (challenge_path / service.path).exists():
             missing_paths.append(service.path)
 
-    result = ""
+    sections = []
 
     if absolute_paths:
-        s = "Paths specified for services are absolute paths:\n"
-        for path in absolute_paths:
-            s += f"  - {path}\n"
-        result += s
+        sections.append(
+            "Paths specified for services are absolute paths:\n"
+            + "\n".join(f"  - {path}" for path in absolute_paths)
+        )
 
     if missing_paths:
-        s = "Paths specified for services do not exist:\n"
-        for path in missing_paths:
-            s += f"  - {path}\n"
-        result += s
+        sections.append(
+            "Paths specified for services do not exist:\n"
+            + "\n".join(f"  - {path}" for path in missing_paths)
+        )
 
-    return result.rstrip() if result else True
+    return "\n".join(sections) if sections else True
@@ -95,29 +95,37 @@ def update_category_readme(name: str):
         challenges_table = "None"
         services_table = "None"
     else:
-        challenges_table = (
-            "| Name | Folder | Description | Difficulty | Author |\n"
-            "|------|--------|-------------|------------|--------|\n"
-        )
-        challenges_table += "\n".join(
-            f"| [{name}](<./{folder}>) | [{folder}](<./{folder}>) | {description} | {difficulty} | {author} |"
-            for name, folder, description, difficulty, author in challenges
+        challenges_table = "\n".join(
+            [
+                "| Name | Folder | Description | Difficulty | Author |",
+                "|------|--------|-------------|------------|--------|",
+                *(
+                    f"| [{name}](<./{folder}>) | [{folder}](<./{folder}>) | {description} | {difficulty} | {author} |"
+                    for name, folder, description, difficulty, author in challenges
+                ),
+            ]
         )
 
-        services_table = (
-            "| Service | Challenge | Ports | Type |\n"
-            "|---------|-----------|-------|------|\n"
-        )
-        services_table += "\n".join(
-            f"| [{service_name}](<./{folder}/{service_path}>) | [{name}](<./{folder}>) | {ports} | {service_type} |"
-            for name, folder, service_name, service_path, ports, service_type in services
+        services_table = "\n".join(
+            [
+                "| Service | Challenge | Ports | Type |",
+                "|---------|-----------|-------|------|",
+                *(
+                    f"| [{service_name}](<./{folder}/{service_path}>) | [{name}](<./{folder}>) | {ports} | {service_type} |"
+                    for name, folder, service_name, service_path, ports, service_type in services
+                ),
+            ]
         )
 
     diff_table = "\n".join(
-        f"| {difficulty.capitalize()} | {count} |"
-        for difficulty, count in distribution.items()
+        [
+            *(
+                f"| {difficulty.capitalize()} | {count} |"
+                for difficulty, count in distribution.items()
+            ),
+            f"| **Total** | **{sum(distribution.values())}** |",
+        ]
     )
-    diff_table += f"\n| **Total** | **{sum(distribution.values())}** |"
 
     category_readme = CATEGORY_README_TEMPLATE.format(
         name=name.capitalize(),
@@ -190,33 +198,38 @@ def update_root_readme():
         challenges_table = "None"
         services_table = "None"
     else:
-        challenges_table = (
-            "| Name | Folder | Description | Category | Difficulty | Author |\n"
-            "|------|--------|-------------|----------|------------|--------|\n"
-        )
-        challenges_table += "\n".join(
-            f"| [{name}](<./{category.lower()}/{folder}>) | [{folder}](<./{category.lower()}/{folder}>) | {description} | {category.capitalize()} | {difficulty} | {author} |"
-            for name, folder, description, category, difficulty, author in challenges
+        challenges_table = "\n".join(
+            [
+                "| Name | Folder | Description | Category | Difficulty | Author |",
+                "|------|--------|-------------|----------|------------|--------|",
+                *(
+                    f"| [{name}](<./{category.lower()}/{folder}>) | [{folder}](<./{category.lower()}/{folder}>) | {description} | {category.capitalize()} | {difficulty} | {author} |"
+                    for name, folder, description, category, difficulty, author in challenges
+                ),
+            ]
         )
 
-        services_table = (
-            "| Service | Challenge | Category | Ports | Type |\n"
-            "|---------|-----------|----------|-------|------|\n"
-        )
-        services_table += "\n".join(
-            f"| [{service_name}](<./{category.lower()}/{folder}/{service_path}>) | [{name}](<./{category.lower()}/{folder}>) | {category.capitalize()} | {ports} | {service_type} |"
-            for name, folder, service_name, service_path, category, ports, service_type in services
+        services_table = "\n".join(
+            [
+                "| Service | Challenge | Category | Ports | Type |",
+                "|---------|-----------|----------|-------|------|",
+                *(
+                    f"| [{service_name}](<./{category.lower()}/{folder}/{service_path}>) | [{name}](<./{category.lower()}/{folder}>) | {category.capitalize()} | {ports} | {service_type} |"
+                    for name, folder, service_name, service_path, category, ports, service_type in services
+                ),
+            ]
         )
 
-    diff_table_header = (
-        "| Category | "
-        + " | ".join(difficulty.capitalize() for difficulty in config.difficulties)
-        + " | Total |\n"
-    )
-    diff_table_header += "|----------|:" + ":|:".join(
-        "-" * len(difficulty) for difficulty in config.difficulties
+    diff_table_header = "\n".join(
+        [
+            "| Category | "
+            + " | ".join(difficulty.capitalize() for difficulty in config.difficulties)
+            + " | Total |",
+            "|----------|:"
+            + ":|:".join("-" * len(difficulty) for difficulty in config.difficulties)
+            + ":|:-----:|",
+        ]
     )
-    diff_table_header += ":|:-----:|"
 
     diff_table_body = "\n".join(
         f"| {category.capitalize()} | "
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
@@ -10,6 +11,24 @@ from ctf_architect.constants import CHALL_README_TEMPLATE
 from ctf_architect.models.base import Model
 from ctf_architect.version import CHALLENGE_SPEC_VERSION, is_supported_challenge_version
 
+_FOLDER_NAME_STRIP_PATTERN = re.compile(r"^[^a-zA-Z]+|[^a-zA-Z0-9 _-]")
+
+
+@lru_cache(maxsize=512)
+def sanitize_folder_name(name: str) -> str:
+    """Creates a folder name from a challenge name.
+
+    Leading non-letters are removed, as are any characters other than letters,
+    digits, spaces, underscores and hyphens.
+
+    Args:
+        name (str): The challenge name.
+
+    Returns:
+        str: The folder name, which is empty if no valid characters are left.
+    """
+    return _FOLDER_NAME_STRIP_PATTERN.sub("", name).strip()
+
 
 class Flag(Model):
     """Represents a challenge flag.
@@ -131,7 +150,7 @@ class Challenge(Model):
     @model_validator(mode="after")
     def _ensure_folder_name(self) -> Challenge:
         if not self.folder_name:
-            sanitized = re.sub(r"^[^a-zA-Z]+|[^a-zA-Z0-9 _-]", "", self.name).strip()
+            sanitized = sanitize_folder_name(self.name)
             if not sanitized:
                 raise ValueError(
                     f'Invalid challenge name, unable to create a valid folder name for "{self.name}"'
@@ -170,13 +189,12 @@ class Challenge(Model):
         if self.files is None:
             files = "None"
         else:
-            files = ""
-            for file in self.files:
-                if isinstance(file, Path):
-                    files += f"- [{file.name}](<{file.as_posix()}>)\n"
-                else:
-                    files += f"- {file}\n"
-            files = files.strip()
+            files = "\n".join(
+                f"- [{file.name}](<{file.as_posix()}>)"
+                if isinstance(file, Path)
+                else f"- {file}"
+                for file in self.files
+            )
 
         if self.flags is None:
             flags = "None"
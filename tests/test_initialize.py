@@ -0,0 +1,71 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ctf_architect.core.challenge import load_chall_config
+from ctf_architect.core.initialize import init_chall
+
+
+class InitChallServiceTest(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+        self.service_path = Path(self._temp_dir.name, "pwn-one")
+        self.service_path.mkdir()
+        (self.service_path / "Dockerfile").write_text("FROM scratch\n")
+
+        self._cwd = os.getcwd()
+        self.addCleanup(os.chdir, self._cwd)
+
+    def _init_chall(self, service_path: Path):
+        init_chall(
+            author="author",
+            category="pwn",
+            description="description",
+            difficulty="easy",
+            name="Pwn One",
+            flags=[{"flag": "flag{test}", "regex": False, "case_insensitive": False}],
+            services=[
+                {
+                    "name": "pwn-one",
+                    "path": service_path,
+                    "ports": [1337],
+                    "type": "tcp",
+                }
+            ],
+        )
+
+    def test_cwd_is_service_folder(self):
+        os.chdir(self.service_path)
+
+        self._init_chall(self.service_path)
+
+        self.assertEqual(
+            sorted(os.listdir(self.service_path)), ["Dockerfile", "Pwn One"]
+        )
+
+        chall_path = self.service_path / "Pwn One"
+        self.assertEqual(os.listdir(chall_path / "service" / "pwn-one"), ["Dockerfile"])
+        self.assertEqual(
+            load_chall_config(chall_path).services[0].path,
+            Path("service", "pwn-one"),
+        )
+
+    def test_cwd_is_inside_service_folder(self):
+        work_path = self.service_path / "work"
+        work_path.mkdir()
+        os.chdir(work_path)
+
+        self._init_chall(self.service_path)
+
+        self.assertEqual(os.listdir(work_path), ["Pwn One"])
+        self.assertEqual(
+            sorted(os.listdir(work_path / "Pwn One" / "service" / "pwn-one")),
+            ["Dockerfile", "work"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()